@@ -9,12 +9,12 @@ while True:
         guess = input("Your guess: ")
 
         # Check that the input is a number
-        if not guess.isdigit():
+        try:
+            guess = int(guess)
+        except ValueError:
             print("Please enter a valid number.")
             continue
 
-        guess = int(guess)
-
         if guess < secret_number:
             print("Too low! Guess again:")
         elif guess > secret_number:
@@ -75,33 +75,92 @@
 # ─────────────────────────────────────────────────────────────────────────────
 
 from __future__ import annotations
+import argparse
 from dataclasses import dataclass
-from enum import Enum
-from typing import Tuple, Iterable
+from functools import cached_property
+from enum import IntEnum
+from typing import Iterable
 import math
-import statistics
 import sys
 import time
 
-class Action(Enum):
-    EVOLVE_OR_DIE = "EVOLVE_OR_DIE"
-    OBSERVE = "OBSERVE"
-    FARM_AND_OPTIMIZE = "FARM_AND_OPTIMIZE"
+import numpy as np
 
-@dataclass
+# Answers accepted as a promise by ask_for_promise().
+_PROMISE_OK = frozenset(("y", "yes", "i promise", "promise"))
+
+class Action(IntEnum):
+    # Values double as the int8 codes returned by toy_policy_batch().
+    EVOLVE_OR_DIE = 0
+    OBSERVE = 1
+    FARM_AND_OPTIMIZE = 2
+
+# Rationale lines printed by demo(), keyed by action.
+_RATIONALES = {
+    Action.EVOLVE_OR_DIE: ("Environment outpaces internal gains; pivot to",
+                           "exploring a new hypothesis/skill pathway."),
+    Action.FARM_AND_OPTIMIZE: ("Leverage current edge; harvest and refine.",),
+    Action.OBSERVE: ("Neither side dominates; probe safely, watch shifts.",),
+}
+
+def _median_diff(v: np.ndarray) -> np.ndarray:
+    """Median of consecutive differences along the last axis (0.0 if < 2)."""
+    if v.shape[-1] < 2:
+        return np.zeros(v.shape[:-1])
+    return np.median(np.diff(v, axis=-1), axis=-1)
+
+@dataclass(frozen=True)
 class SignalWindow:
     """Tiny helper for toy trend estimation (public-safe, non-IP)."""
-    values: Tuple[float, ...]
+    values: np.ndarray
+
+    def __post_init__(self) -> None:
+        # One contiguous float64 buffer instead of a tuple of boxed floats.
+        # We keep a private read-only copy so the cached trend can't go stale.
+        values = np.array(self.values, dtype=np.float64)
+        if values.ndim != 1:
+            raise TypeError("SignalWindow expects a 1-D sequence of values")
+        values.flags.writeable = False
+        object.__setattr__(self, "values", values)
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare arrays elementwise; compare whole windows.
+        if not isinstance(other, SignalWindow):
+            return NotImplemented
+        if other is self:
+            return True  # like tuples: a NaN-bearing window still equals itself
+        return np.array_equal(self.values, other.values)
+
+    def __hash__(self) -> int:
+        # Hash the raw buffer (ndarrays aren't hashable); "+ 0.0" folds -0.0
+        # into 0.0 so windows that compare equal also hash equal.
+        return hash((self.values + 0.0).tobytes())
 
+    @cached_property
     def trend(self) -> float:
         """
         Return a robust-ish slope proxy without giving away anything fancy.
         Here we use a median-based finite difference as a placeholder.
         """
-        if len(self.values) < 2:
-            return 0.0
-        diffs = [b - a for a, b in zip(self.values[:-1], self.values[1:])]
-        return statistics.median(diffs)
+        return float(_median_diff(self.values))
+
+def _classify(delta: np.ndarray, tau_pos: float, tau_neg: float) -> np.ndarray:
+    """Map trend deltas to int8 Action codes (same precedence as toy_policy)."""
+    out = np.full(delta.shape, Action.OBSERVE, dtype=np.int8)
+    out[delta > tau_pos] = Action.FARM_AND_OPTIMIZE
+    out[delta < tau_neg] = Action.EVOLVE_OR_DIE  # written last: EVOLVE wins
+    return out
+
+def toy_policy_batch(q_self: np.ndarray, q_env: np.ndarray,
+                     tau_pos: float = 0.2, tau_neg: float = -0.2) -> np.ndarray:
+    """
+    Vectorized toy comparator over many window pairs at once.
+    Trends are taken along the last axis; returns int8 action codes
+    (0 = EVOLVE_OR_DIE, 1 = OBSERVE, 2 = FARM_AND_OPTIMIZE).
+    """
+    delta = (_median_diff(np.asarray(q_self, dtype=np.float64))
+             - _median_diff(np.asarray(q_env, dtype=np.float64)))
+    return _classify(np.asarray(delta), tau_pos, tau_neg)
 
 def toy_policy(q_self: SignalWindow, q_env: SignalWindow,
                tau_pos: float = 0.2, tau_neg: float = -0.2) -> Action:
@@ -110,7 +169,7 @@ def toy_policy(q_self: SignalWindow, q_env: SignalWindow,
     DO NOT confuse this with the full method; it only demonstrates the *shape*
     of decision-making without revealing the real signal stack.
     """
-    delta = q_self.trend() - q_env.trend()
+    delta = q_self.trend - q_env.trend
     if delta < tau_neg:
         return Action.EVOLVE_OR_DIE
     elif delta > tau_pos:
@@ -118,6 +177,13 @@ def toy_policy(q_self: SignalWindow, q_env: SignalWindow,
     else:
         return Action.OBSERVE
 
+def _batch_agrees(q_self: np.ndarray, q_env: np.ndarray,
+                  tau_pos: float = 0.2, tau_neg: float = -0.2) -> bool:
+    """Sanity check: toy_policy_batch matches toy_policy row by row."""
+    codes = toy_policy_batch(q_self, q_env, tau_pos, tau_neg)
+    return all(code == toy_policy(SignalWindow(s), SignalWindow(e), tau_pos, tau_neg)
+               for code, s, e in zip(codes, q_self, q_env))
+
 def ask_for_promise() -> bool:
     """
     Playful prompt gate. We don’t gatekeep knowledge; we gatekeep vibes. 😄
@@ -126,7 +192,7 @@ def ask_for_promise() -> bool:
     print("   Promise you'll keep it to yourself or use it for the benefit")
     print("   of your community, your nation, or the planet? (yes/no)")
     ans = input("> ").strip().lower()
-    if ans in {"y", "yes", "i promise", "promise"}:
+    if ans in _PROMISE_OK:
         return True
     print("Fair enough. Curiosity is a virtue—responsibility is too. ✨")
     return False
@@ -137,30 +203,28 @@ def demo() -> None:
     We synthesize two short windows of signals and run the toy policy.
     """
     # Synthetic “internal capability” drift (e.g., learning progress proxy)
-    q_self_vals = (0.0, 0.1, 0.18, 0.25, 0.29)
+    q_self_vals = np.array([0.0, 0.1, 0.18, 0.25, 0.29], dtype=np.float64)
     # Synthetic “environmental pressure/opportunity” drift
-    q_env_vals  = (0.0, 0.12, 0.22, 0.31, 0.41)
+    q_env_vals  = np.array([0.0, 0.12, 0.22, 0.31, 0.41], dtype=np.float64)
 
     q_self = SignalWindow(q_self_vals)
     q_env  = SignalWindow(q_env_vals)
 
     act = toy_policy(q_self, q_env)
+    # The batch kernel must agree with the scalar comparator (both orderings).
+    assert _batch_agrees(np.stack([q_self_vals, q_env_vals]),
+                         np.stack([q_env_vals, q_self_vals]))
 
     print("\n[TEASER OUTPUT]")
-    print(f"  trend(Q_self) ≈ {q_self.trend():+.3f}")
-    print(f"  trend(Q_env)  ≈ {q_env.trend():+.3f}")
+    print(f"  trend(Q_self) ≈ {q_self.trend:+.3f}")
+    print(f"  trend(Q_env)  ≈ {q_env.trend:+.3f}")
 
     # We print a high-level decision without divulging internal mechanics.
-    if act is Action.EVOLVE_OR_DIE:
-        print("  decision      → EVOLVE_OR_DIE")
-        print("  rationale     → Environment outpaces internal gains; pivot to")
-        print("                   exploring a new hypothesis/skill pathway.")
-    elif act is Action.FARM_AND_OPTIMIZE:
-        print("  decision      → FARM_AND_OPTIMIZE")
-        print("  rationale     → Leverage current edge; harvest and refine.")
-    else:
-        print("  decision      → OBSERVE")
-        print("  rationale     → Neither side dominates; probe safely, watch shifts.")
+    why = _RATIONALES[act]
+    print(f"  decision      → {act.name}")
+    print(f"  rationale     → {why[0]}")
+    for line in why[1:]:
+        print(f"                   {line}")
 
     print("\nNote:")
     print("  This is a public teaser. The actual signal discovery & governance")
@@ -179,13 +243,20 @@ def reveal_a_hint():
     print("  Everything else is redacted █████████████████████████████.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ARC-Style Novel Reasoner — Teaser")
+    parser.add_argument("--no-sleep", action="store_true",
+                        help="skip the dramatic pauses (handy for scripted runs)")
+    args = parser.parse_args()
+
     print("ARC-Style Novel Reasoner — Teaser (v0)")
     print("Learning in public. Be kind; commit often. 🧪")
-    time.sleep(0.3)
+    if not args.no_sleep:
+        time.sleep(0.3)
 
     if ask_for_promise():
         reveal_a_hint()
-        time.sleep(0.2)
+        if not args.no_sleep:
+            time.sleep(0.2)
         demo()
     else:
         # Exit quietly without running the demo.